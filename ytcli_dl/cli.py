@@ -31,6 +31,7 @@ import click
 from . import __version__
 from .config import DEFAULT_DOWNLOAD_DIR, QUALITY_OPTIONS
 from .downloader import YouTubeDownloader, list_video_formats
+from .profiler import DownloadProfiler
 from .utils import read_urls_from_file, validate_url, validate_playlist_url
 
 class CustomChoice(click.Choice):
@@ -116,8 +117,23 @@ class NoBlankLineCommand(click.Command):
     type=CustomString(),
     help='Download specific format (e.g., "137+140" for 1080p video + audio)'
 )
+@click.option(
+    '--profile',
+    is_flag=True,
+    help='Time each download phase and write profiling reports to the output directory'
+)
+@click.option(
+    '--profile-memory',
+    is_flag=True,
+    help='Also trace memory allocations with tracemalloc (implies --profile)'
+)
+@click.option(
+    '--profile-cpu',
+    is_flag=True,
+    help='Also run cProfile and write a .pstats file (implies --profile)'
+)
 @click.version_option(__version__, '-v', '--version', prog_name='ytcli-dl')
-def main(url, quality, audio_only, output, playlist, file, list_formats, format_code):
+def main(url, quality, audio_only, output, playlist, file, list_formats, format_code, profile, profile_memory, profile_cpu):
     
     if list_formats:
         if not url:
@@ -142,12 +158,20 @@ def main(url, quality, audio_only, output, playlist, file, list_formats, format_
         click.echo("Try 'ytcli-dl -h' for help.", err=True)
         sys.exit(1)
 
+    profiler = DownloadProfiler(
+        output_dir=output,
+        enabled=profile,
+        trace_memory=profile_memory,
+        enabled_cprofile=profile_cpu
+    )
+
     try:
         downloader = YouTubeDownloader(
             output_dir=output,
             quality=quality,
             audio_only=audio_only,
-            format_code=format_code
+            format_code=format_code,
+            profiler=profiler
         )
 
         click.echo(f"Output directory: {downloader.output_dir}")
@@ -163,6 +187,7 @@ def main(url, quality, audio_only, output, playlist, file, list_formats, format_
         sys.exit(1)
 
     success = False
+    profiler.start()
 
     try:
         if file:
@@ -193,6 +218,9 @@ def main(url, quality, audio_only, output, playlist, file, list_formats, format_
         click.echo(f"Error: Unexpected error - {str(e)}", err=True)
         click.echo("Try 'ytcli-dl -h' for help.", err=True)
         sys.exit(1)
+    finally:
+        profiler.stop()
+        profiler.write_reports()
 
     if success:
         click.secho("Download completed successfully!", fg='green')
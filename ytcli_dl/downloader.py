@@ -30,6 +30,7 @@ from typing import List, Dict, Any, Optional
 import yt_dlp
 import click
 from .config import DEFAULT_YDL_OPTS, QUALITY_OPTIONS, AUDIO_FORMAT
+from .profiler import DownloadProfiler
 from .utils import (
     validate_url, 
     validate_playlist_url, 
@@ -40,11 +41,12 @@ from .utils import (
 
 class YouTubeDownloader:
     
-    def __init__(self, output_dir, quality='best', audio_only=False, format_code=None):
+    def __init__(self, output_dir, quality='best', audio_only=False, format_code=None, profiler=None):
         self.output_dir = create_output_dir(output_dir)
         self.quality = quality
         self.audio_only = audio_only
         self.format_code = format_code
+        self.profiler = profiler or DownloadProfiler()
         self.ydl_opts = self._build_ydl_opts()
     
     def _build_ydl_opts(self) -> Dict[str, Any]:
@@ -54,7 +56,8 @@ class YouTubeDownloader:
         opts['overwrites'] = True
         opts['quiet'] = True
         opts['no_warnings'] = True
-        opts['progress_hooks'] = [self._minimal_progress_hook]
+        opts['progress_hooks'] = [self._minimal_progress_hook] + self.profiler.progress_hooks
+        opts['postprocessor_hooks'] = self.profiler.postprocessor_hooks
 
         if self.format_code:
             opts['format'] = self.format_code
@@ -92,7 +95,7 @@ class YouTubeDownloader:
     
     def get_video_info(self, url: str) -> Optional[Dict[str, Any]]:
         try:
-            with yt_dlp.YoutubeDL({'quiet': True}) as ydl:
+            with self.profiler.phase('extract_info'), yt_dlp.YoutubeDL({'quiet': True}) as ydl:
                 info = ydl.extract_info(url, download=False)
                 return info
         except Exception as e:
@@ -133,9 +136,9 @@ class YouTubeDownloader:
                     click.echo(f" - {filename}")
             
             opts_with_hooks = self.ydl_opts.copy()
-            opts_with_hooks['progress_hooks'] = [enhanced_progress_hook]
+            opts_with_hooks['progress_hooks'] = [enhanced_progress_hook] + self.profiler.progress_hooks
             
-            with yt_dlp.YoutubeDL(opts_with_hooks) as ydl:
+            with self.profiler.phase('ydl_download'), yt_dlp.YoutubeDL(opts_with_hooks) as ydl:
                 try:
                     ydl.download([url])
                 except SystemExit as e:
@@ -173,7 +176,9 @@ class YouTubeDownloader:
                 click.echo(f"Playlist: {playlist_title}")
                 click.echo(f"Videos: {video_count}")
                 
-                if not click.confirm(f"Download all {video_count} videos?"):
+                with self.profiler.phase('confirm'):
+                    confirmed = click.confirm(f"Download all {video_count} videos?")
+                if not confirmed:
                     click.echo("Download cancelled.")
                     return False
                 
@@ -189,7 +194,7 @@ class YouTubeDownloader:
                 else:
                     click.echo(f"Downloading playlist in {self.quality} quality...")
                 
-                with yt_dlp.YoutubeDL(playlist_opts) as ydl:
+                with self.profiler.phase('ydl_download'), yt_dlp.YoutubeDL(playlist_opts) as ydl:
                     ydl.download([url])
                 
                 click.secho("Playlist download completed!", fg='green')
@@ -214,10 +219,11 @@ class YouTubeDownloader:
             click.echo(f"[{i}/{total_urls}] Processing: {url}")
             
             try:
-                if validate_playlist_url(url):
-                    success = self.download_playlist(url)
-                else:
-                    success = self.download_single_video(url)
+                with self.profiler.phase('url'):
+                    if validate_playlist_url(url):
+                        success = self.download_playlist(url)
+                    else:
+                        success = self.download_single_video(url)
                 
                 results[url] = success
                 
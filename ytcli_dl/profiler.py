@@ -0,0 +1,226 @@
+"""
+ytcli-dl -- A minimal command-line YouTube downloader.
+
+MIT License
+
+Copyright (c) 2025 Alessandro Chitarrini
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import cProfile
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+import click
+from .utils import create_output_dir, format_bytes
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+ROOT_PHASE = 'ytcli-dl'
+
+def _children_cpu_time() -> float:
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+class DownloadProfiler:
+
+    def __init__(self, output_dir: Optional[str] = None, enabled=False, trace_memory=False,
+                 enabled_cprofile=False):
+        self.output_dir = output_dir
+        self.enabled = enabled or trace_memory or enabled_cprofile
+        self.trace_memory = trace_memory
+        self.enabled_cprofile = enabled_cprofile
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self._stack: List[Dict[str, Any]] = []
+        self._profile: Optional[cProfile.Profile] = None
+        self._peak_memory = 0
+        self._snapshot = None
+
+    @property
+    def progress_hooks(self) -> List:
+        return [self._progress_hook] if self.enabled else []
+
+    @property
+    def postprocessor_hooks(self) -> List:
+        return [self._postprocessor_hook] if self.enabled else []
+
+    def start(self) -> None:
+        if not self.enabled:
+            return
+        if self.trace_memory:
+            tracemalloc.start()
+        if self.enabled_cprofile:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self.begin(ROOT_PHASE)
+
+    def stop(self) -> None:
+        if not self.enabled or ROOT_PHASE not in self.stats:
+            return
+        self.end(ROOT_PHASE)
+        if self._profile is not None:
+            self._profile.disable()
+        if self.trace_memory:
+            self._peak_memory = tracemalloc.get_traced_memory()[1]
+            self._snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+    def begin(self, name: str) -> None:
+        if not self.enabled:
+            return
+        path = f"{self._stack[-1]['path']};{name}" if self._stack else name
+        self.stats.setdefault(path, {
+            'calls': 0, 'wall': 0.0, 'self': 0.0, 'cpu': 0.0, 'child_cpu': 0.0, 'memory': 0,
+        })
+        self._stack.append({
+            'name': name,
+            'path': path,
+            'wall': time.perf_counter(),
+            'cpu': time.process_time(),
+            'child_cpu': _children_cpu_time(),
+            'memory': tracemalloc.get_traced_memory()[0] if self.trace_memory else 0,
+            'children': 0.0,
+        })
+
+    def end(self, name: str) -> None:
+        if not self.enabled or not any(frame['name'] == name for frame in self._stack):
+            return
+        # Phases opened from yt-dlp hooks are not closed when a download
+        # aborts, so unwind them together with the phase that owns them.
+        while self._stack:
+            frame = self._stack.pop()
+            wall = time.perf_counter() - frame['wall']
+            entry = self.stats[frame['path']]
+            entry['calls'] += 1
+            entry['wall'] += wall
+            entry['self'] += wall - frame['children']
+            entry['cpu'] += time.process_time() - frame['cpu']
+            entry['child_cpu'] += _children_cpu_time() - frame['child_cpu']
+            if self.trace_memory:
+                entry['memory'] += tracemalloc.get_traced_memory()[0] - frame['memory']
+            if self._stack:
+                self._stack[-1]['children'] += wall
+            if frame['name'] == name:
+                break
+
+    @contextmanager
+    def phase(self, name: str):
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def _is_open(self, name: str) -> bool:
+        return bool(self._stack) and self._stack[-1]['name'] == name
+
+    def _progress_hook(self, d):
+        if d['status'] == 'downloading':
+            if not self._is_open('transfer'):
+                self.begin('transfer')
+        elif d['status'] in ('finished', 'error'):
+            self.end('transfer')
+
+    def _postprocessor_hook(self, d):
+        name = f"postprocess:{d.get('postprocessor', 'unknown')}"
+        if d['status'] == 'started':
+            self.begin(name)
+        elif d['status'] == 'finished':
+            self.end(name)
+
+    def format_summary(self) -> List[str]:
+        total = self.stats.get(ROOT_PHASE, {}).get('wall') or 1.0
+        header = f"{'Phase':<44} {'Calls':>6} {'Wall s':>9} {'Self s':>9} {'CPU s':>8} {'Child CPU s':>12} {'%':>6}"
+        if self.trace_memory:
+            header += f" {'Mem delta':>10}"
+        lines = [header, '-' * len(header)]
+
+        for path, entry in self.stats.items():
+            depth = path.count(';')
+            label = '  ' * depth + path.rsplit(';', 1)[-1]
+            line = (
+                f"{label[:44]:<44} {int(entry['calls']):>6} {entry['wall']:>9.3f} "
+                f"{entry['self']:>9.3f} {entry['cpu']:>8.3f} {entry['child_cpu']:>12.3f} "
+                f"{100.0 * entry['wall'] / total:>6.1f}"
+            )
+            if self.trace_memory:
+                sign = '-' if entry['memory'] < 0 else ''
+                line += f" {sign + format_bytes(abs(entry['memory'])):>10}"
+            lines.append(line)
+
+        if resource is None:
+            lines.append("Note: child CPU time (ffmpeg) is not available on this platform")
+        if self.enabled_cprofile:
+            lines.append("Note: cProfile was active, wall and CPU times are inflated")
+        if self.trace_memory:
+            lines.append("Note: tracemalloc was active, wall and CPU times are inflated")
+            lines.append(f"Peak traced memory: {format_bytes(self._peak_memory)}")
+            if self._snapshot is not None:
+                lines.append("Top allocation sites:")
+                for stat in self._snapshot.statistics('lineno')[:10]:
+                    lines.append(f"  {stat}")
+        return lines
+
+    def format_folded(self) -> List[str]:
+        lines = []
+        for path, entry in self.stats.items():
+            self_ms = int(round(entry['self'] * 1000))
+            if self_ms > 0:
+                lines.append(f"{path} {self_ms}")
+        return lines
+
+    def write_reports(self) -> Optional[str]:
+        if not self.enabled or ROOT_PHASE not in self.stats:
+            return None
+
+        summary = self.format_summary()
+        reports = []
+
+        try:
+            output_dir = create_output_dir(self.output_dir or os.getcwd())
+            prefix = os.path.join(output_dir, f"ytcli-profile-{time.strftime('%Y%m%d-%H%M%S')}")
+            with open(f"{prefix}.txt", 'w', encoding='utf-8') as f:
+                f.write('\n'.join(summary) + '\n')
+            reports.append(f"{prefix}.txt")
+            with open(f"{prefix}.folded", 'w', encoding='utf-8') as f:
+                f.write('\n'.join(self.format_folded()) + '\n')
+            reports.append(f"{prefix}.folded")
+            if self._profile is not None:
+                self._profile.dump_stats(f"{prefix}.pstats")
+                reports.append(f"{prefix}.pstats")
+        except OSError as e:
+            click.echo(f"Warning: Failed to write profile reports - {e}", err=True)
+            prefix = None
+
+        click.echo("=" * 50)
+        click.echo("Profile Summary:")
+        for line in summary:
+            click.echo(line)
+        if reports:
+            click.echo(f"Profile reports: {', '.join(reports)}")
+        click.echo("=" * 50)
+        return prefix